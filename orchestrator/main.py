@@ -51,20 +51,147 @@ import re
 import argparse
 import json
 import logging
+import hashlib
+import shutil
+import importlib.util
+import tempfile
+import functools
+import threading
+import queue
+import collections
 import concurrent.futures
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict, Tuple
 from tqdm import tqdm
 
+try:
+    # orjson이 설치되어 있으면 서명 파일 파싱에 사용 (C 구현으로 표준 json 모듈보다 빠름)
+    import orjson
+except ImportError:
+    orjson = None
+
+# Poetry 프로젝트 경로 -> 해당 가상환경의 Python 실행 파일 경로
+# 실행 중에는 가상환경 위치가 바뀌지 않으므로, 시작 시 한 번만 조회하여 모든 학생 처리에 재사용합니다.
+_VENV_PYTHON: Dict[Path, Path] = {}
+# 도구 프로젝트 경로 -> 대기 중인 상주 Python 프로세스(작업자) 큐
+# 작업자는 가상환경의 Python에서 `_TOOL_WORKER_SRC`를 실행하며, 표준 입력으로 받은 작업을 차례로 처리합니다.
+# 학생마다 인터프리터를 새로 띄우고 도구 모듈과 의존성을 다시 import하는 비용을 없애기 위해 사용합니다.
+_TOOL_WORKERS: Dict[Path, queue.Queue] = {}
+# 상주 작업자가 시작 후 준비 완료를 알릴 때까지 기다리는 최대 시간(초)
+TOOL_WORKER_READY_TIMEOUT = 30
+
+# 상주 작업자 프로세스의 소스 ('python -u -c'로 전달)
+# 시작 직후 준비 완료 한 줄({"ready": true})을 보낸 뒤 요청을 기다림
+# 요청 한 줄: {"module": 모듈 이름, "jobs": [인자 목록, ...]} / 응답 한 줄: {"ok": bool, "error": 오류 메시지 또는 null}
+# 도구가 출력하는 내용이 응답과 섞이지 않도록, 원래의 stdout은 응답 전용으로 복제해 두고 fd 1은 devnull로 돌림
+# 각 작업은 `_MODULE_BATCH_RUNNER`와 같이 runpy로 실행하며, 실패 시 도구의 stderr 출력을 오류 메시지로 돌려줌
+# stderr는 fd 2를 임시 파일로 돌려 수집하고 sys.stderr 객체는 그대로 두므로, 도구가 첫 작업에서
+# sys.stderr에 묶어 둔 logging 핸들러의 출력도 이후 작업마다 빠짐없이 수집됨 (작업 전마다 파일을 비움)
+_TOOL_WORKER_SRC = """
+import json, os, runpy, sys, tempfile, traceback
+protocol_out = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+stderr_file = tempfile.TemporaryFile()
+os.dup2(stderr_file.fileno(), 2)
+def read_stderr():
+    sys.stderr.flush()
+    stderr_file.seek(0)
+    return stderr_file.read().decode('utf-8', errors='replace')
+protocol_out.write(json.dumps({'ready': True}) + '\\n')
+protocol_out.flush()
+for request_line in sys.stdin:
+    request = json.loads(request_line)
+    error = None
+    for job_args in request['jobs']:
+        sys.stderr.flush()
+        stderr_file.seek(0)
+        stderr_file.truncate()
+        sys.argv = [request['module']] + job_args
+        try:
+            runpy.run_module(request['module'], run_name='__main__', alter_sys=True)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                error = read_stderr() + f'(exit code: {e.code})'
+        except Exception:
+            error = read_stderr() + traceback.format_exc()
+        if error is not None:
+            break
+    protocol_out.write(json.dumps({'ok': error is None, 'error': error}) + '\\n')
+    protocol_out.flush()
+"""
+
+# inspector 표준 출력에서 최종 점수를 추출하는 패턴 (학생마다 다시 컴파일하지 않도록 모듈 수준에서 한 번만 컴파일)
+# 출력을 문자열로 디코딩하지 않고 UTF-8 바이트 그대로 검색하므로 바이트 패턴으로 컴파일
+_SCORE_RE_B = re.compile(r"⏺︎ 최종 앙상블 점수: (\d+) / 100".encode('utf-8'))
+
+# 동시에 실행되는 inspector 프로세스 수의 상한 (main에서 --inspector-concurrency 값으로 다시 설정)
+# 학생 처리 스레드 수는 대기 위주의 작업에 맞춰 코어 수보다 많게 잡으므로, CPU를 많이 쓰는 inspector는 따로 제한
+_INSPECTOR_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+# loose-diff 스크립트에서 가져온 비교 함수 (compare_files(a, b) -> bool)
+# 시작 시 한 번 import하여 학생마다 Python 프로세스를 띄우지 않고 같은 프로세스에서 호출합니다.
+# import할 수 없는 경우 None으로 남고, 기존처럼 스크립트를 별도 프로세스로 실행합니다.
+_COMPARE_FILES: Optional[Callable[[Path, Path], bool]] = None
+
+# 'poetry install' 후 조회한 가상환경 Python 경로를 기록해 두는 파일 (각 도구 프로젝트 폴더에 생성)
+VENV_PYTHON_SIDECAR = ".venv_python"
+# 마지막으로 'poetry install'에 성공했을 때의 poetry.lock/pyproject.toml 해시를 기록해 두는 파일
+POETRY_STAMP_FILE = ".orchestrator_poetry_stamp"
+
+# 하나의 Python 인터프리터 안에서 같은 모듈을 여러 인자 목록으로 차례로 실행하는 러너 ('python -c'로 전달)
+# 'python -m'과 같은 방식(runpy)으로 모듈을 실행하되, 인터프리터 기동과 의존성 import 비용은 한 번만 지불합니다.
+# 인자: sys.argv[1] = 모듈 이름, sys.argv[2] = 인자 목록의 JSON 배열
+_MODULE_BATCH_RUNNER = """
+import json, runpy, sys
+module_name, jobs = sys.argv[1], json.loads(sys.argv[2])
+for job_args in jobs:
+    sys.argv = [module_name] + job_args
+    try:
+        runpy.run_module(module_name, run_name='__main__', alter_sys=True)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise
+"""
+
 # ==============================================================================
 #   헬퍼 함수 (Helper Functions)
 # ==============================================================================
 # 이 섹션의 함수들은 외부 프로세스를 실행하고 그 결과를 처리하는 저수준(low-level) 작업을 담당합니다.
 
+@functools.lru_cache(maxsize=1024)
+def _rel(path_str: str, base_str: str) -> str:
+    # 예외(ValueError)를 흐름 제어에 쓰는 Path.relative_to 대신 문자열 접두사 비교로 판단
+    path_str = str(Path(path_str))
+    if not base_str or not os.path.isabs(path_str):
+        return path_str
+    norm_path, norm_base = os.path.normcase(path_str), os.path.normcase(base_str.rstrip(os.sep) + os.sep)
+    if norm_path.startswith(norm_base):
+        return path_str[len(norm_base):]
+    return "." if norm_path == norm_base.rstrip(os.sep) else path_str
+
+def to_relative_str(path_to_convert, base_display_path: Optional[Path]) -> str:
+    """
+    로그 출력용으로 경로를 기준 경로에 대한 상대 경로 문자열로 변환합니다. 기준 경로 밖의 경로는 그대로 반환합니다.
+    base_display_path는 호출하는 쪽에서 미리 resolve()한 절대 경로여야 합니다. (로그 한 줄마다 파일 시스템을 조회하지 않기 위함)
+    같은 경로가 학생마다 반복해서 출력되므로 변환 결과를 캐시합니다.
+    """
+    return _rel(str(path_to_convert), str(base_display_path) if base_display_path else "")
+
+def compute_poetry_project_digest(project_path: Path) -> str:
+    """Poetry 프로젝트의 의존성 정의 파일(poetry.lock, pyproject.toml) 내용으로 SHA-256 해시를 계산합니다."""
+    hasher = hashlib.sha256()
+    for name in ["poetry.lock", "pyproject.toml"]:
+        file_path = project_path / name
+        hasher.update(name.encode())
+        hasher.update(file_path.read_bytes() if file_path.exists() else b"<missing>")
+    return hasher.hexdigest()
+
 def ensure_poetry_project_ready(project_path: Path) -> bool:
     """
     주어진 Poetry 프로젝트의 의존성을 확인하고 필요한 경우 'poetry install'을 실행합니다.
     스크립트의 주 로직이 도구 실행에만 집중할 수 있도록 사전 준비 작업을 분리합니다.
+    설치가 끝나면 가상환경의 Python 경로를 조회하여 프로젝트 폴더의 `.venv_python` 파일에 기록합니다.
+    poetry.lock/pyproject.toml이 마지막 설치 성공 이후 바뀌지 않았고 가상환경이 그대로 있다면 설치를 건너뜁니다.
     :param project_path: 확인할 Poetry 프로젝트의 경로
     :return: 준비 성공 시 True, 실패 시 False
     """
@@ -73,6 +200,17 @@ def ensure_poetry_project_ready(project_path: Path) -> bool:
     if not (project_path / "pyproject.toml").exists():
         logging.error(f"'{project_path}' 폴더에서 'pyproject.toml' 파일을 찾을 수 없습니다.")
         return False
+
+    # 의존성 정의가 마지막 설치 성공 때와 같고 가상환경 Python이 남아 있으면 poetry를 실행하지 않음
+    project_digest = compute_poetry_project_digest(project_path)
+    stamp_path, sidecar_path = project_path / POETRY_STAMP_FILE, project_path / VENV_PYTHON_SIDECAR
+    try:
+        if (stamp_path.read_text(encoding='utf-8').strip() == project_digest
+                and Path(sidecar_path.read_text(encoding='utf-8').strip()).exists()):
+            logging.info(f"'{project_name}' 의존성 변경 없음. 'poetry install'을 건너뜁니다.")
+            return True
+    except OSError:
+        pass  # 기록 파일이 없으면 (최초 실행 등) 설치를 진행
     
     command = ["poetry", "install"]
     logging.info(f"  실행: {' '.join(command)} (최초 실행 시 시간이 걸릴 수 있습니다)...")
@@ -81,10 +219,8 @@ def ensure_poetry_project_ready(project_path: Path) -> bool:
         # cwd=project_path: 명령어 실행 위치를 해당 프로젝트 폴더로 지정
         subprocess.run(
             command, check=True, cwd=project_path,
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE  # 성공/실패 시의 출력은 로깅에서 처리하므로 숨김
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE  # 오류 메시지(stderr)만 로깅에 사용하므로 stdout은 버림
         )
-        logging.info(f"'{project_name}' 의존성 준비 완료.")
-        return True
     except FileNotFoundError:
         logging.error("'poetry' 명령어를 찾을 수 없습니다. 시스템에 Poetry가 설치되어 있고 PATH에 등록되었는지 확인하세요.")
         return False
@@ -93,45 +229,222 @@ def ensure_poetry_project_ready(project_path: Path) -> bool:
         logging.error(f"'{project_name}' 프로젝트에서 'poetry install' 실행에 실패했습니다.\n{e.stderr.decode()}")
         return False
 
-def run_poetry_project(project_path: Path, module_name: str, args: Optional[List[str]] = None, base_display_path: Optional[Path] = None) -> bool:
+    # 실행 중에는 poetry를 전혀 호출하지 않도록, 가상환경 Python 경로를 한 번 조회하여 파일로 남김
+    python_executable = resolve_venv_python(project_path)
+    if python_executable is None:
+        return False
+    try:
+        sidecar_path.write_text(str(python_executable), encoding='utf-8')
+        stamp_path.write_text(project_digest, encoding='utf-8')
+    except OSError as e:
+        logging.error(f"'{project_name}' 가상환경 경로를 기록할 수 없습니다: {e}")
+        return False
+    logging.info(f"'{project_name}' 의존성 준비 완료.")
+    return True
+
+def resolve_venv_python(project_path: Path) -> Optional[Path]:
+    """
+    'poetry env info -p'로 Poetry 프로젝트의 가상환경 위치를 조회하여 Python 실행 파일 경로를 반환합니다.
+    :param project_path: 조회할 Poetry 프로젝트의 경로
+    :return: Python 실행 파일 경로, 조회 실패 시 None
+    """
+    project_name = project_path.name
+    try:
+        venv_path_result = subprocess.run(["poetry", "env", "info", "-p"], cwd=project_path, capture_output=True, text=True, check=True)
+    except (FileNotFoundError, subprocess.CalledProcessError) as e:
+        error_message = getattr(e, 'stderr', str(e))
+        logging.error(f"'{project_name}' 가상환경 위치를 확인할 수 없습니다:\n{error_message}")
+        return None
+    venv_path = Path(venv_path_result.stdout.strip())
+    python_executable = (venv_path / "Scripts" / "python.exe") if sys.platform == "win32" else (venv_path / "bin" / "python")
+    if not python_executable.exists():
+        logging.error(f"가상환경에서 Python 실행 파일을 찾을 수 없습니다: {python_executable}")
+        return None
+    return python_executable
+
+def load_venv_python(project_path: Path) -> Optional[Path]:
+    """
+    `ensure_poetry_project_ready`가 기록한 `.venv_python` 파일에서 가상환경 Python 경로를 읽어 `_VENV_PYTHON`에 등록합니다.
+    이후 `run_poetry_project`는 poetry 프로세스 없이 이 경로의 Python을 직접 실행합니다.
+    :return: Python 실행 파일 경로, 파일이 없거나 경로가 유효하지 않으면 None
+    """
+    sidecar_path = project_path / VENV_PYTHON_SIDECAR
+    try:
+        python_executable = Path(sidecar_path.read_text(encoding='utf-8').strip())
+    except OSError:
+        logging.error(f"가상환경 경로 파일을 읽을 수 없습니다: {sidecar_path}")
+        return None
+    if not python_executable.exists():
+        logging.error(f"가상환경에서 Python 실행 파일을 찾을 수 없습니다: {python_executable}")
+        return None
+    _VENV_PYTHON[project_path] = python_executable
+    logging.info(f"'{project_path.name}' 가상환경 Python: {python_executable}")
+    return python_executable
+
+def _spawn_tool_worker(project_path: Path) -> subprocess.Popen:
+    """도구 프로젝트의 가상환경 Python으로 상주 작업자 프로세스 하나를 시작합니다."""
+    return subprocess.Popen(
+        [str(_VENV_PYTHON[project_path]), "-u", "-c", _TOOL_WORKER_SRC],
+        cwd=project_path, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, encoding='utf-8'
+    )
+
+def _wait_for_worker_ready(worker: subprocess.Popen) -> bool:
+    """
+    작업자가 보내는 준비 완료 줄을 `TOOL_WORKER_READY_TIMEOUT`초까지 기다립니다.
+    작업자가 곧바로 종료되었거나(EOF), 다른 내용을 보냈거나, 시간 안에 응답하지 않으면 False를 반환합니다.
+    """
+    ready_lines: List[str] = []
+    # 파이프 읽기에는 시간 제한을 걸 수 없으므로 별도 스레드에서 읽고, 스레드 종료를 시간 제한과 함께 기다림
+    reader = threading.Thread(target=lambda: ready_lines.append(worker.stdout.readline()), daemon=True)
+    reader.start()
+    reader.join(TOOL_WORKER_READY_TIMEOUT)
+    if reader.is_alive() or not ready_lines:
+        return False
+    try:
+        return json.loads(ready_lines[0]).get('ready') is True
+    except (json.JSONDecodeError, AttributeError):
+        return False
+
+def _kill_worker(worker: subprocess.Popen) -> None:
+    worker.kill()
+    worker.wait()
+
+def _spawn_ready_tool_worker(project_path: Path) -> Optional[subprocess.Popen]:
+    """작업자 프로세스를 시작하고 준비 완료를 확인합니다. 시작하지 못했거나 준비되지 않으면 None을 반환합니다."""
+    try:
+        worker = _spawn_tool_worker(project_path)
+    except OSError as e:
+        logging.warning(f"'{project_path.name}' 상주 프로세스를 시작할 수 없습니다: {e}")
+        return None
+    if not _wait_for_worker_ready(worker):
+        logging.warning(f"'{project_path.name}' 상주 프로세스가 준비 완료를 알리지 않았습니다. (종료 코드: {worker.poll()})")
+        _kill_worker(worker)
+        return None
+    return worker
+
+def start_tool_workers(project_path: Path, worker_count: int) -> bool:
+    """
+    도구 프로젝트마다 `worker_count`개의 상주 작업자 프로세스를 미리 시작합니다.
+    각 작업자가 준비 완료를 알려야 시작에 성공한 것으로 보며, 작업자가 준비된 도구는
+    `run_poetry_project_batch`가 새 프로세스 대신 작업자에게 작업을 보냅니다.
+    :return: 시작 성공 시 True, 실패 시 False (이 경우 기존처럼 실행마다 새 프로세스를 사용)
+    """
+    idle_workers = queue.Queue()
+    for _ in range(worker_count):
+        worker = _spawn_ready_tool_worker(project_path)
+        if worker is None:
+            logging.warning(f"'{project_path.name}' 상주 프로세스를 사용할 수 없어 실행마다 새 프로세스를 사용합니다.")
+            _stop_worker_queue(idle_workers)
+            return False
+        idle_workers.put(worker)
+    _TOOL_WORKERS[project_path] = idle_workers
+    logging.info(f"'{project_path.name}' 상주 프로세스 {worker_count}개 시작")
+    return True
+
+def _stop_worker_queue(idle_workers: queue.Queue) -> None:
+    while not idle_workers.empty():
+        worker = idle_workers.get_nowait()
+        try:
+            worker.stdin.close()  # 입력이 끝나면 작업자는 스스로 종료
+            worker.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            worker.kill()
+            worker.wait()
+
+def stop_tool_workers() -> None:
+    """시작된 모든 상주 작업자 프로세스를 종료합니다."""
+    for idle_workers in _TOOL_WORKERS.values():
+        _stop_worker_queue(idle_workers)
+    _TOOL_WORKERS.clear()
+
+def run_in_tool_worker(project_path: Path, module_name: str, args_list: List[List[str]]) -> Tuple[bool, Optional[str]]:
+    """
+    대기 중인 상주 작업자 하나를 꺼내 모듈 실행 작업을 보내고 결과를 기다립니다.
+    작업자가 비정상 종료된 경우 새 작업자로 교체합니다.
+    :return: (작업자 응답 여부, 오류 메시지) - 응답이 있었고 성공했으면 (True, None),
+             도구가 실패했으면 (True, 오류 메시지), 작업자가 응답 없이 종료되었으면 (False, None)
+    """
+    idle_workers = _TOOL_WORKERS[project_path]
+    worker = idle_workers.get()
+    try:
+        try:
+            worker.stdin.write(json.dumps({'module': module_name, 'jobs': args_list}) + "\n")
+            worker.stdin.flush()
+            response_line = worker.stdout.readline()
+        except OSError:
+            response_line = ""
+        if not response_line:
+            _kill_worker(worker)
+            # 교체에 실패하면 종료된 작업자를 그대로 돌려놓아, 다음 사용 시 다시 교체를 시도
+            worker = _spawn_ready_tool_worker(project_path) or worker
+            return False, None
+        response = json.loads(response_line)
+        return True, None if response['ok'] else response['error']
+    finally:
+        idle_workers.put(worker)
+
+def run_poetry_project(project_path: Path, module_name: str, args: Optional[List[str]] = None, base_display_path: Optional[Path] = None, discard_stdout: bool = False) -> bool:
     """
     지정된 Poetry 프로젝트의 가상환경에 설치된 Python으로 특정 모듈을 실행합니다.
-    'poetry run' 대신 가상환경의 python 실행 파일을 직접 찾아 실행하여 더 명시적이고 안정적입니다.
+    'poetry run' 대신 가상환경의 python 실행 파일을 직접 실행하여 더 명시적이고 안정적입니다.
+    가상환경의 Python 경로는 시작 시 `load_venv_python`으로 읽어 둔 값(`_VENV_PYTHON`)을 사용하므로,
+    학생별 처리 과정에서는 poetry 프로세스가 전혀 실행되지 않습니다.
     :param project_path: 실행할 Poetry 프로젝트 경로
     :param module_name: 실행할 모듈 이름 (예: 'mission_decoder.main')
     :param args: 모듈에 전달할 커맨드 라인 인자 리스트
     :param base_display_path: 로그에 경로를 출력할 때 사용할 기준 경로 (상대 경로로 예쁘게 출력하기 위함)
+    :param discard_stdout: True이면 모듈의 표준 출력을 버림 (오류 보고에 필요한 stderr만 수집)
     :return: 실행 성공 시 True, 실패 시 False
     """
-    # ... (내부 로직은 이전과 동일하며 충분히 명확) ...
+    return run_poetry_project_batch(project_path, module_name, [args or []], base_display_path, discard_stdout)
+
+def run_poetry_project_batch(project_path: Path, module_name: str, args_list: List[List[str]], base_display_path: Optional[Path] = None, discard_stdout: bool = False) -> bool:
+    """
+    `run_poetry_project`와 같지만, 여러 인자 목록에 대한 모듈 실행을 하나의 Python 프로세스에서 차례로 처리합니다.
+    도구의 상주 작업자가 준비되어 있으면 작업자에게 보내고, 그렇지 않으면 새 프로세스를 띄웁니다.
+    (인자 목록이 하나뿐이면 'python -m'으로, 둘 이상이면 `_MODULE_BATCH_RUNNER`로 실행)
+    :param args_list: 실행별 커맨드 라인 인자 리스트의 목록
+    :return: 모든 실행이 성공하면 True, 하나라도 실패하면 False (실패한 이후의 실행은 수행되지 않음)
+    """
     project_name = project_path.name
     logging.info(f"Poetry 프로젝트 실행: {project_name}")
-    safe_args = args or []
-    def to_relative_str(path_to_convert):
-        path = Path(path_to_convert)
-        if base_display_path and path.is_absolute():
-            try: return str(path.relative_to(base_display_path.resolve()))
-            except ValueError: return str(path)
-        return str(path)
+    python_executable = _VENV_PYTHON.get(project_path)
+    if python_executable is None:
+        logging.error(f"'{project_name}' 가상환경 Python 경로가 준비되지 않았습니다.")
+        return False
+    use_worker = project_path in _TOOL_WORKERS
     try:
-        venv_path_result = subprocess.run(["poetry", "env", "info", "-p"], cwd=project_path, capture_output=True, text=True, check=True)
-        venv_path = Path(venv_path_result.stdout.strip())
-        python_executable = (venv_path / "Scripts" / "python.exe") if sys.platform == "win32" else (venv_path / "bin" / "python")
-        if not python_executable.exists():
-            logging.error(f"가상환경에서 Python 실행 파일을 찾을 수 없습니다: {to_relative_str(python_executable)}")
-            return False
-        
-        command = [str(python_executable), "-m", module_name] + safe_args
-        logging.info(f"  실행 명령어: [venv: {project_name}] python -m {module_name}")
+        if len(args_list) == 1:
+            command = [str(python_executable), "-m", module_name] + args_list[0]
+        else:
+            command = [str(python_executable), "-c", _MODULE_BATCH_RUNNER, module_name, json.dumps(args_list)]
+        batch_note = f" (일괄 실행 {len(args_list)}건)" if len(args_list) > 1 else ""
+        worker_note = " (상주 프로세스)" if use_worker else ""
+        logging.info(f"  실행 명령어: [venv: {project_name}] python -m {module_name}{batch_note}{worker_note}")
         arg_labels = ["  * 입력", "  * 출력", "  * 키"]
         if "decoder" in module_name: arg_labels = ["  * 대상 파일", "  * 개인 키", "  * 출력 파일"]
-        for i, arg in enumerate(safe_args):
-            label = arg_labels[i] if i < len(arg_labels) else f"  * 인자[{i+1}]"
-            arg_path = (project_path / arg).resolve() if not Path(arg).is_absolute() else Path(arg)
-            logging.info(f"{label}: {to_relative_str(arg_path)}")
-        logging.info(f"  실행 위치: {to_relative_str(project_path)}")
-        
-        subprocess.run(command, check=True, cwd=project_path, capture_output=True, text=True)
+        for safe_args in args_list:
+            for i, arg in enumerate(safe_args):
+                label = arg_labels[i] if i < len(arg_labels) else f"  * 인자[{i+1}]"
+                arg_path = os.path.normpath(project_path / arg) if not Path(arg).is_absolute() else arg
+                logging.info(f"{label}: {to_relative_str(arg_path, base_display_path)}")
+        logging.info(f"  실행 위치: {to_relative_str(project_path, base_display_path)}")
+
+        if use_worker:
+            # 상주 작업자는 도구의 표준 출력을 항상 버리고, 실패 시 stderr 내용만 돌려줌
+            worker_responded, error_message = run_in_tool_worker(project_path, module_name, args_list)
+            if worker_responded:
+                if error_message is not None:
+                    logging.error(f"'{project_name}' 실행 중 문제 발생:\n{error_message}")
+                    return False
+                logging.info(f"완료: {project_name}")
+                return True
+            # 작업자 자체가 죽은 것은 도구가 입력을 거부한 것과 다르므로, 실패로 처리하지 않고 새 프로세스로 다시 실행
+            logging.warning(f"'{project_name}' 상주 프로세스가 응답 없이 종료되어 새 프로세스로 다시 실행합니다.")
+
+        # 표준 출력은 어디에서도 쓰이지 않으므로, 요청 시 파이프 대신 DEVNULL로 보내 버퍼 할당과 디코딩을 생략
+        stdout_target = subprocess.DEVNULL if discard_stdout else subprocess.PIPE
+        subprocess.run(command, check=True, cwd=project_path, stdout=stdout_target, stderr=subprocess.PIPE, text=True)
         logging.info(f"완료: {project_name}")
         return True
     except (FileNotFoundError, subprocess.CalledProcessError) as e:
@@ -147,16 +460,10 @@ def run_plain_python_script(script_path: Path, args: Optional[List[str]] = None,
     logging.info(f"Python 스크립트 실행: {script_name}")
     safe_args = args or []
     command = [sys.executable, str(script_path)] + safe_args
-    def to_relative_str(path_to_convert):
-        path = Path(path_to_convert)
-        if base_display_path and path.is_absolute():
-            try: return str(path.relative_to(base_display_path.resolve()))
-            except ValueError: return str(path)
-        return str(path)
-    logging.info(f"  실행 명령어: python {to_relative_str(script_path)}")
+    logging.info(f"  실행 명령어: python {to_relative_str(script_path, base_display_path)}")
     if len(safe_args) >= 2:
-        logging.info(f"  * 파일 A: {to_relative_str(safe_args[0])}")
-        logging.info(f"  * 파일 B: {to_relative_str(safe_args[1])}")
+        logging.info(f"  * 파일 A: {to_relative_str(safe_args[0], base_display_path)}")
+        logging.info(f"  * 파일 B: {to_relative_str(safe_args[1], base_display_path)}")
     try:
         result = subprocess.run(command, check=True, capture_output=True, text=True)
         logging.info(f"완료: {script_name}")
@@ -165,15 +472,55 @@ def run_plain_python_script(script_path: Path, args: Optional[List[str]] = None,
         logging.error(f"'{script_name}' 실행 중 문제 발생:\n{e.stderr}")
         return None
 
-def run_executable(
-    executable_path: Path, 
-    positional_args: Optional[List[str]] = None, # 수정: List[str] 또는 None 허용
-    named_args: Optional[Dict[str, str]] = None, # 수정: Dict[str, str] 또는 None 허용
-    base_display_path: Optional[Path] = None,
-) -> Optional[subprocess.CompletedProcess]:
-    """컴파일된 실행 파일을 위치 및 이름 기반 인자로 실행하고, 결과를 반환합니다."""
-    exe_name = executable_path.name
-    logging.info(f"실행 파일 실행: {exe_name}")
+def load_diff_function(script_path: Path) -> Optional[Callable[[Path, Path], bool]]:
+    """
+    loose-diff 스크립트를 모듈로 import하여 비교 함수(`compare_files`)를 가져옵니다.
+    함수가 '같으면 True, 다르면 False'를 반환하는지 사용 전에 한 번 확인합니다.
+    (동일한 파일과 명백히 다른 파일을 비교해 보고, bool이 아닌 값을 반환하거나 결과가 맞지 않으면 사용하지 않음)
+    :return: 비교 함수, 스크립트를 import할 수 없거나 함수가 없거나 확인에 실패하면 None
+    """
+    try:
+        spec = importlib.util.spec_from_file_location(f"_orchestrator_{script_path.stem}", script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except (Exception, SystemExit) as e:
+        logging.warning(f"'{script_path.name}'을(를) import할 수 없어 별도 프로세스로 실행합니다: {e}")
+        return None
+    compare_files = getattr(module, "compare_files", None)
+    if not callable(compare_files):
+        logging.warning(f"'{script_path.name}'에 compare_files 함수가 없어 별도 프로세스로 실행합니다.")
+        return None
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_a, file_b = Path(tmp_dir) / "a.py", Path(tmp_dir) / "b.py"
+            file_a.write_text("value = 1\nprint(value)\n", encoding='utf-8')
+            file_b.write_text("def other():\n    return 'different'\n", encoding='utf-8')
+            same_result, different_result = compare_files(file_a, file_a), compare_files(file_a, file_b)
+    except Exception as e:
+        logging.warning(f"'{script_path.name}'의 compare_files 확인 중 오류가 발생하여 별도 프로세스로 실행합니다: {e}")
+        return None
+    if same_result is not True or different_result is not False:
+        logging.warning(
+            f"'{script_path.name}'의 compare_files가 예상한 결과(동일: True, 다름: False)를 반환하지 않아 별도 프로세스로 실행합니다. "
+            f"(동일: {same_result!r}, 다름: {different_result!r})"
+        )
+        return None
+    logging.info(f"'{script_path.name}'의 비교 함수를 프로세스 내에서 사용합니다.")
+    return compare_files
+
+def disable_in_process_diff() -> None:
+    """프로세스 내 비교 함수를 더 이상 사용하지 않도록 하여, 이후 일치도 검사는 스크립트를 별도 프로세스로 실행합니다."""
+    global _COMPARE_FILES
+    _COMPARE_FILES = None
+
+def _prepare_executable_command(
+    executable_path: Path,
+    positional_args: Optional[List[str]],
+    named_args: Optional[Dict[str, str]],
+    base_display_path: Optional[Path],
+) -> List[str]:
+    """실행 파일의 커맨드 라인을 구성하고, 실행 정보를 로그에 기록합니다. (`run_executable` 계열 함수의 공통 부분)"""
+    logging.info(f"실행 파일 실행: {executable_path.name}")
     pos_args = positional_args or []
     named_args_list = []
     if named_args:
@@ -181,32 +528,76 @@ def run_executable(
             named_args_list.extend([f"--{key}", str(value)])
     command = [str(executable_path)] + named_args_list + pos_args
     execution_directory = executable_path.parent
-    def to_relative_str(path_to_convert):
-        path = Path(path_to_convert)
-        if base_display_path and path.is_absolute():
-            try: return str(path.relative_to(base_display_path.resolve()))
-            except ValueError: return str(path)
-        return str(path)
-    logging.info(f"  실행 명령어: {to_relative_str(executable_path)}")
-    logging.info(f"  실행 위치: {to_relative_str(execution_directory)}")
+    logging.info(f"  실행 명령어: {to_relative_str(executable_path, base_display_path)}")
+    logging.info(f"  실행 위치: {to_relative_str(execution_directory, base_display_path)}")
     if named_args:
         for key, value in named_args.items():
             abs_value_path = Path(value) if Path(value).is_absolute() else (execution_directory / value)
-            logging.info(f"  * --{key}: {to_relative_str(abs_value_path)}")
+            logging.info(f"  * --{key}: {to_relative_str(abs_value_path, base_display_path)}")
     for i, arg in enumerate(pos_args):
         abs_arg_path = Path(arg) if Path(arg).is_absolute() else (execution_directory / arg)
-        logging.info(f"  * 위치 인자 #{i+1}: {to_relative_str(abs_arg_path)}")
+        logging.info(f"  * 위치 인자 #{i+1}: {to_relative_str(abs_arg_path, base_display_path)}")
+    return command
+
+def run_executable(
+    executable_path: Path, 
+    positional_args: Optional[List[str]] = None, # 수정: List[str] 또는 None 허용
+    named_args: Optional[Dict[str, str]] = None, # 수정: Dict[str, str] 또는 None 허용
+    base_display_path: Optional[Path] = None,
+) -> Optional[subprocess.CompletedProcess]:
+    """
+    컴파일된 실행 파일을 위치 및 이름 기반 인자로 실행하고, 결과를 반환합니다.
+    출력 전체를 문자열로 디코딩하지 않도록 결과의 stdout은 bytes로 반환하며, 필요한 부분만 호출하는 쪽에서 디코딩합니다.
+    """
+    exe_name = executable_path.name
+    command = _prepare_executable_command(executable_path, positional_args, named_args, base_display_path)
     try:
-        result = subprocess.run(command, check=True, capture_output=True, text=True, encoding='utf-8', cwd=execution_directory)
+        result = subprocess.run(command, check=True, capture_output=True, cwd=executable_path.parent)
         logging.info(f"완료: {exe_name}")
         return result
     except FileNotFoundError:
         logging.error(f"실행 파일을 찾을 수 없습니다: {executable_path}")
         return None
     except subprocess.CalledProcessError as e:
-        logging.error(f"'{exe_name}' 실행 중 문제 발생:\n{e.stderr}")
+        logging.error(f"'{exe_name}' 실행 중 문제 발생:\n{e.stderr.decode('utf-8', errors='replace')}")
         return None
 
+def run_executable_streaming(
+    executable_path: Path,
+    line_pattern: re.Pattern,
+    positional_args: Optional[List[str]] = None,
+    named_args: Optional[Dict[str, str]] = None,
+    base_display_path: Optional[Path] = None,
+) -> Tuple[bool, Optional[re.Match]]:
+    """
+    `run_executable`과 같지만, 출력 전체를 메모리에 모으지 않고 한 줄씩 읽으면서 `line_pattern`과 처음 일치하는 줄만 찾습니다.
+    나머지 출력은 읽어서 버립니다. (파이프를 닫으면 도구가 남은 출력을 쓰다가 실패할 수 있으므로 끝까지 읽음)
+    실패 시 오류 메시지로 남기기 위해 마지막 몇 줄만 보관하며, stderr는 stdout에 합쳐서 읽습니다.
+    출력은 디코딩하지 않고 바이트 그대로 검색하며, 오류 메시지로 남길 때만 디코딩합니다.
+    :param line_pattern: 찾을 줄의 정규식 패턴 (바이트 패턴)
+    :return: (실행 성공 여부, 처음 일치한 결과 또는 None)
+    """
+    exe_name = executable_path.name
+    command = _prepare_executable_command(executable_path, positional_args, named_args, base_display_path)
+    match = None
+    output_tail = collections.deque(maxlen=20)
+    try:
+        with subprocess.Popen(
+            command, cwd=executable_path.parent, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        ) as proc:
+            for line in proc.stdout:
+                if match is None:
+                    match = line_pattern.search(line)
+                output_tail.append(line)
+    except FileNotFoundError:
+        logging.error(f"실행 파일을 찾을 수 없습니다: {executable_path}")
+        return False, None
+    if proc.returncode != 0:
+        logging.error(f"'{exe_name}' 실행 중 문제 발생 (종료 코드 {proc.returncode}):\n{b''.join(output_tail).decode('utf-8', errors='replace')}")
+        return False, None
+    logging.info(f"완료: {exe_name}")
+    return True, match
+
 def parse_signature_file(filepath: Path) -> str:
     """signature.decrypted 파일을 안전하게 파싱하여 'city' 정보를 추출합니다."""
     logging.info(f"서명 파일 분석: {filepath.name}")
@@ -214,8 +605,9 @@ def parse_signature_file(filepath: Path) -> str:
         logging.warning(f"서명 파일을 찾을 수 없음: {filepath}")
         return "FILE_NOT_FOUND"
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로 아래의 예외 처리가 그대로 적용됨
+        raw = filepath.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         # .get()을 연쇄적으로 사용하여 키가 없더라도 KeyError 없이 안전하게 접근
         city = data.get("location_info", {}).get("city")
         if city and isinstance(city, str):
@@ -231,19 +623,176 @@ def parse_signature_file(filepath: Path) -> str:
         logging.error(f"알 수 없는 파싱 오류: {filepath} ({e})")
         return "UNKNOWN_PARSING_ERROR"
 
+def compute_poetry_tool_fingerprint(project_path: Path) -> str:
+    """
+    Poetry 도구 프로젝트의 버전을 나타내는 해시를 계산합니다. (결과 캐시 키에 사용)
+    의존성 정의(poetry.lock/pyproject.toml), 사용 중인 가상환경 Python 경로, 프로젝트 내 Python 소스 파일의
+    경로/크기/수정 시각을 포함하므로, 도구를 업그레이드하거나 의존성을 바꾸면 값이 달라집니다.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(compute_poetry_project_digest(project_path).encode())
+    hasher.update(str(_VENV_PYTHON.get(project_path, "")).encode())
+    for dir_path, dir_names, file_names in os.walk(project_path):
+        # 가상환경, 캐시 등 숨김 폴더와 바이트코드 폴더는 제외하고, 순회 순서를 고정
+        dir_names[:] = sorted(d for d in dir_names if not d.startswith('.') and d != "__pycache__")
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py"):
+                stat = (Path(dir_path) / file_name).stat()
+                rel_name = os.path.relpath(Path(dir_path) / file_name, project_path)
+                hasher.update(f"{rel_name}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+    return hasher.hexdigest()
+
+def compute_submission_cache_key(input_paths: List[Path], tool_paths: List[Path], duration: int, cache_salt: str) -> str:
+    """
+    학생 입력 파일의 내용과 도구 파일의 수정 시각, 분석 시간을 묶어 결과 캐시의 키를 계산합니다.
+    입력이나 도구가 하나라도 바뀌면 키가 달라지므로, 이전 실행 결과를 안전하게 재사용할 수 있습니다.
+    :param cache_salt: 모든 학생에게 공통인 실행 환경 정보 (Poetry 도구 버전, 산출물 파일 이름 등, main에서 한 번만 계산)
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(cache_salt.encode())
+    hasher.update(b"\0")
+    for path in input_paths:
+        hasher.update(path.read_bytes() if path.exists() else b"<missing>")
+        hasher.update(b"\0")
+    for path in tool_paths:
+        hasher.update(str(path.stat().st_mtime_ns if path.exists() else -1).encode())
+        hasher.update(b"\0")
+    hasher.update(str(duration).encode())
+    return hasher.hexdigest()
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """src 파일을 dst 위치에 하드링크로 연결하고, 하드링크가 불가능한 환경(다른 파일 시스템 등)에서는 복사합니다."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def load_cached_result(cache_dir: Path, cache_key: str, output_dir: Path) -> Optional[Dict]:
+    """
+    캐시 항목이 있으면 저장된 산출물을 학생 출력 폴더로 되살리고 결과 딕셔너리를 반환합니다.
+    :return: 캐시된 결과, 캐시 항목이 없거나 손상된 경우 None
+    """
+    entry_file = cache_dir / f"{cache_key}.json"
+    entry_dir = cache_dir / cache_key
+    if not entry_file.exists():
+        return None
+    restored: List[Path] = []
+    try:
+        with open(entry_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        for name in entry['artifacts']:
+            link_or_copy(entry_dir / name, output_dir / name)
+            restored.append(output_dir / name)
+        return entry['result']
+    except (OSError, KeyError, json.JSONDecodeError) as e:
+        logging.warning(f"캐시 항목을 사용할 수 없어 다시 처리합니다: {entry_file} ({e})")
+        # 일부만 되살린 산출물은 캐시와 하드링크로 연결되어 있으므로, 다시 처리하기 전에 제거
+        for path in restored:
+            path.unlink(missing_ok=True)
+        return None
+
+def store_cached_result(cache_dir: Path, cache_key: str, output_dir: Path, artifact_names: List[str], result: Dict) -> None:
+    """처리 결과와 산출물을 캐시에 저장합니다. 학생별로 가장 최근 항목 하나만 유지합니다."""
+    entry_dir = cache_dir / cache_key
+    try:
+        if cache_dir.exists():
+            shutil.rmtree(cache_dir)
+        entry_dir.mkdir(parents=True)
+        saved = []
+        for name in artifact_names:
+            if (output_dir / name).exists():
+                link_or_copy(output_dir / name, entry_dir / name)
+                saved.append(name)
+        with open(cache_dir / f"{cache_key}.json", 'w', encoding='utf-8') as f:
+            json.dump({'result': result, 'artifacts': saved}, f, ensure_ascii=False)
+    except OSError as e:
+        logging.warning(f"결과 캐시 저장에 실패했습니다: {cache_dir} ({e})")
+
+def sort_report_csv(report_csv_path: Path, sort_key: str) -> None:
+    """
+    완료 순서대로 기록된 CSV 리포트를 `sort_key` 열 기준으로 정렬하여 다시 씁니다.
+    임시 파일에 먼저 쓴 뒤 `os.replace`로 교체하므로, 도중에 실패해도 기존 리포트는 손상되지 않습니다.
+    """
+    with open(report_csv_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        rows = sorted(reader, key=lambda row: row[sort_key])
+    tmp_path = report_csv_path.with_name(report_csv_path.name + ".tmp")
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, report_csv_path)
+
 # ==============================================================================
 #   핵심 파이프라인 함수 (Core Pipeline Function)
 # ==============================================================================
+def decrypt_then_restore(
+    student_id: str,
+    files_to_decrypt: List[Tuple[Path, Path]],
+    restore_io: Optional[Tuple[Path, Path]],
+    paths: Dict[str, Path],
+    rel_paths: Dict[str, str]
+) -> str:
+    """
+    복호화(STEP A)와 코드 복원(STEP B)을 하나로 연결하여 실행합니다.
+    각 단계는 실행 전에 필요한 입력이 준비되었는지 먼저 확인하여, 실패할 것이 분명한 도구 프로세스는 띄우지 않습니다.
+    코드 복원은 이번 실행에서 복호화가 성공했을 때만 이어서 실행됩니다.
+    :param files_to_decrypt: (암호화된 입력 파일, 복호화 결과 파일) 목록
+    :param restore_io: (복호화된 로그, 복원 코드 출력 파일), 코드 복원을 생략하려면 None
+    :return: 'OK', 'DECRYPT_FAILED' 또는 'RESTORE_FAILED'
+    """
+    # --- STEP A: 복호화 ---
+    logging.info(f"--- {student_id}: 단계 A (복호화) ---")
+    # 로그와 서명 파일의 복호화를 하나의 decoder 프로세스에서 일괄 처리 (인터프리터 기동 비용을 한 번만 지불)
+    decoder_jobs = []
+    for input_path, output_path in files_to_decrypt:
+        if not input_path.exists():
+            logging.warning(f"{student_id}: 건너뛰기 - {input_path.name} 파일 없음")
+            continue
+        decoder_jobs.append([
+            os.path.relpath(input_path, start=paths['decoder_project_path']),
+            rel_paths['decoder_key'],
+            os.path.relpath(output_path, start=paths['decoder_project_path']),
+        ])
+    if decoder_jobs:
+        if not paths['private_key_path'].exists():
+            logging.error(f"{student_id}: 개인 키 파일을 찾을 수 없어 복호화할 수 없습니다: {paths['private_key_path']}")
+            return "DECRYPT_FAILED"
+        if not run_poetry_project_batch(paths['decoder_project_path'], "mission_decoder.main", decoder_jobs, paths['root_dir'], discard_stdout=True):
+            return "DECRYPT_FAILED"
+
+    # --- STEP B: 코드 복원 ---
+    # 복호화가 실패했다면 위에서 이미 반환되므로, 여기에는 복호화가 성공한 경우에만 도달
+    if restore_io is None:
+        return "OK"
+    logging.info(f"--- {student_id}: 단계 B (코드 복원) ---")
+    log_decrypted_path_abs, log_restored_path_abs = restore_io
+    if not log_decrypted_path_abs.exists():
+        return "RESTORE_FAILED"
+    restore_args = [os.path.relpath(p, start=paths['restore_project_path']) for p in [log_decrypted_path_abs, log_restored_path_abs]]
+    if not run_poetry_project(paths['restore_project_path'], "mission_restore.main", restore_args, paths['root_dir'], discard_stdout=True):
+        return "RESTORE_FAILED"
+    return "OK"
+
 def process_student_submission(
     student_dir: Path, 
     paths: Dict[str, Path],
     config: Dict,
     cli_args: argparse.Namespace, 
-    duplication_map: Dict[str, str]
+    duplication_map: Dict[str, str],
+    rel_paths: Dict[str, str],
+    cache_salt: str,
+    representative: Optional[Dict] = None
 ) -> Dict:
     """
     한 학생의 제출물에 대한 전체 처리 파이프라인을 실행합니다.
     이 함수는 독립적으로 실행 가능하며, 병렬 처리를 위해 스레드 풀의 작업 단위로 사용됩니다.
+    :param rel_paths: 학생과 무관하게 고정된 상대 경로 (main에서 한 번만 계산, 예: decoder 기준 개인 키 경로)
+    :param cache_salt: 결과 캐시 키에 함께 넣을 공통 실행 환경 정보 (`compute_submission_cache_key` 참고)
+    :param representative: 같은 중복 그룹(동일한 log.encrypted)에서 먼저 처리된 대표 학생의 결과 행.
+                           대표의 처리가 성공했다면 로그에서만 파생되는 산출물(복호화 로그, 복원 코드, 과정 분석)을 재사용합니다.
     :return: CSV 리포트에 기록될 한 행의 데이터 (딕셔셔리 형태)
     """
     student_id = student_dir.name
@@ -267,45 +816,81 @@ def process_student_submission(
     log_decrypted_path_abs = student_output_dir_abs / ofs['log_decrypted']
     signature_decrypted_path_abs = student_output_dir_abs / ofs['signature_decrypted']
     log_restored_path_abs = student_output_dir_abs / ofs['log_restored']
+    html_report_path_abs = student_output_dir_abs / ofs['inspection_report_html']
+    duplication_group = duplication_map.get(student_id, 'UNIQUE')
 
-    # --- STEP A: 복호화 ---
-    logging.info(f"--- {student_id}: 단계 A (복호화) ---")
-    files_to_decrypt = [(log_encrypted_path_abs, log_decrypted_path_abs), (signature_encrypted_path_abs, signature_decrypted_path_abs)]
-    decryption_ok = True
-    for input_path, output_path in files_to_decrypt:
-        if not input_path.exists():
-            logging.warning(f"{student_id}: 건너뛰기 - {input_path.name} 파일 없음")
-            continue
-        decoder_args = [os.path.relpath(p, start=paths['decoder_project_path']) for p in [input_path, paths['private_key_path'], output_path]]
-        if not run_poetry_project(paths['decoder_project_path'], "mission_decoder.main", decoder_args, paths['root_dir']):
-            decryption_ok = False; break
-    if not decryption_ok: pipeline_status = "DECRYPT_FAILED"
+    # --- 결과 캐시 확인 ---
+    # 입력 파일과 도구가 이전 실행과 같다면 모든 단계를 건너뛰고 저장된 결과와 산출물을 재사용
+    artifact_names = [ofs['log_decrypted'], ofs['signature_decrypted'], ofs['log_restored'], ofs['inspection_report_html']]
+    student_cache_dir = paths['cache_dir'] / student_id
+    cache_key = compute_submission_cache_key(
+        [log_encrypted_path_abs, signature_encrypted_path_abs, original_main_py_path],
+        [paths['private_key_path'], paths['inspector_exe_path'], paths['diff_script_path']],
+        cli_args.duration, cache_salt,
+    )
+    # 이전 실행의 산출물을 먼저 제거하여, 이번 실행(또는 캐시 항목)에서 만들어지지 않은 파일이 남지 않도록 함
+    # 캐시 재사용 여부와 관계없이 수행하여 두 경우의 출력 폴더 상태를 같게 유지
+    # (캐시와 하드링크로 연결된 파일을 도구가 덮어써 캐시가 오염되는 것도 방지)
+    for name in artifact_names:
+        (student_output_dir_abs / name).unlink(missing_ok=True)
+    if not cli_args.no_cache and (cached := load_cached_result(student_cache_dir, cache_key, student_output_dir_abs)):
+        logging.info(f"🏁 처리 완료 (캐시 재사용): {student_id}, 최종 상태: {cached['status']}")
+        return {**cached, 'duplication_group': duplication_group}
 
-    # --- STEP B: 코드 복원 ---
-    # 이전 단계(복호화)가 실패했다면 이 단계를 건너뛴다.
-    if pipeline_status == "OK":
-        logging.info(f"--- {student_id}: 단계 B (코드 복원) ---")
-        if not log_decrypted_path_abs.exists(): pipeline_status = "RESTORE_FAILED"
-        else:
-            restore_args = [os.path.relpath(p, start=paths['restore_project_path']) for p in [log_decrypted_path_abs, log_restored_path_abs]]
-            if not run_poetry_project(paths['restore_project_path'], "mission_restore.main", restore_args, paths['root_dir']): pipeline_status = "RESTORE_FAILED"
+    # --- 중복 그룹 대표 결과 재사용 ---
+    # log.encrypted가 대표 학생과 동일하므로, 로그에서만 파생되는 산출물은 다시 만들 필요가 없음
+    # 서명(위치 정보)과 원본 코드는 학생마다 다를 수 있으므로 서명 복호화와 일치도 검사는 그대로 수행
+    shared_names = [ofs['log_decrypted'], ofs['log_restored'], ofs['inspection_report_html']]
+    reuse_representative = False
+    if representative and isinstance(representative.get('process_analysis_score'), int):
+        representative_dir = paths['processed_base_dir'] / representative['student_id']
+        if all((representative_dir / name).exists() for name in shared_names):
+            for name in shared_names:
+                link_or_copy(representative_dir / name, student_output_dir_abs / name)
+            reuse_representative = True
+            logging.info(f"{student_id}: 중복 그룹 대표({representative['student_id']})의 복호화/복원/과정 분석 결과를 재사용합니다.")
+
+    # --- STEP A + B: 복호화 후 코드 복원 (연결 실행) ---
+    # 대표 학생의 결과를 재사용하는 경우 로그 복호화와 코드 복원은 생략하고 서명만 복호화
+    files_to_decrypt = [(log_encrypted_path_abs, log_decrypted_path_abs), (signature_encrypted_path_abs, signature_decrypted_path_abs)]
+    if reuse_representative: files_to_decrypt = files_to_decrypt[1:]
+    restore_io = None if reuse_representative else (log_decrypted_path_abs, log_restored_path_abs)
+    pipeline_status = decrypt_then_restore(student_id, files_to_decrypt, restore_io, paths, rel_paths)
 
     # --- STEP C: 일치도 검사 ---
     if pipeline_status == "OK":
         logging.info(f"--- {student_id}: 단계 C (일치도 검사) ---")
         if not original_main_py_path.exists() or not log_restored_path_abs.exists(): comparison_result = "FILE_MISSING"
         else:
-            # UnboundLocalError를 방지하기 위해 변수 정의와 사용을 명확히 분리
-            diff_args = [str(original_main_py_path), str(log_restored_path_abs)]
-            diff_result = run_plain_python_script(paths['diff_script_path'], diff_args, paths['root_dir'])
-            if diff_result and "✅ 파일이 실질적으로 동일합니다" in diff_result.stdout: comparison_result = "OK"
-            elif diff_result: comparison_result = "DIFFERENT"
-            else: comparison_result = "CHECK_FAILED"
+            compare_files = _COMPARE_FILES
+            if compare_files is not None:
+                # 시작 시 import해 둔 비교 함수를 같은 프로세스에서 직접 호출
+                try:
+                    is_same = compare_files(original_main_py_path, log_restored_path_abs)
+                except Exception as e:
+                    logging.error(f"{student_id}: 일치도 검사 중 문제 발생 ({e})")
+                    is_same = None
+                    comparison_result = "CHECK_FAILED"
+                if isinstance(is_same, bool):
+                    comparison_result = "OK" if is_same else "DIFFERENT"
+                elif is_same is not None:
+                    # bool이 아닌 값은 신뢰할 수 없으므로 이후로는 프로세스 내 비교를 쓰지 않고, 이 학생부터 출력 문자열 방식으로 검사
+                    logging.warning(f"{student_id}: compare_files가 bool이 아닌 값({is_same!r})을 반환하여 별도 프로세스로 다시 검사합니다.")
+                    disable_in_process_diff()
+                    compare_files = None
+            if compare_files is None:
+                # UnboundLocalError를 방지하기 위해 변수 정의와 사용을 명확히 분리
+                diff_args = [str(original_main_py_path), str(log_restored_path_abs)]
+                diff_result = run_plain_python_script(paths['diff_script_path'], diff_args, paths['root_dir'])
+                if diff_result and "✅ 파일이 실질적으로 동일합니다" in diff_result.stdout: comparison_result = "OK"
+                elif diff_result: comparison_result = "DIFFERENT"
+                else: comparison_result = "CHECK_FAILED"
 
     # --- STEP D: 과정 분석 ---
-    if pipeline_status == "OK":
+    if pipeline_status == "OK" and reuse_representative:
+        analysis_score = representative['process_analysis_score']
+    elif pipeline_status == "OK":
         logging.info(f"--- {student_id}: 단계 D (과정 분석) ---")
-        html_report_path_abs = student_output_dir_abs / ofs['inspection_report_html']
         if not paths['inspector_exe_path'].exists(): analysis_score = "ANALYZER_MISSING"
         elif not log_decrypted_path_abs.exists(): analysis_score = "FILE_MISSING"
         else:
@@ -314,33 +899,39 @@ def process_student_submission(
                 "duration": str(cli_args.duration),
                 "html-output": os.path.relpath(html_report_path_abs, start=paths['inspector_exe_path'].parent)
             }
-            inspector_result = run_executable(paths['inspector_exe_path'], named_args=inspector_named_args, base_display_path=paths['root_dir'])
-            if inspector_result:
-                score_pattern = re.compile(r"⏺︎ 최종 앙상블 점수: (\d+) / 100")
-                match = score_pattern.search(inspector_result.stdout)
-                analysis_score = int(match.group(1)) if match else "SCORE_NOT_FOUND"
-            else: analysis_score = "ANALYSIS_FAILED"
+            # inspector 출력은 클 수 있으므로 전체를 모으지 않고 한 줄씩 읽으며 점수 줄만 찾음
+            with _INSPECTOR_SLOTS:
+                inspector_ok, score_match = run_executable_streaming(paths['inspector_exe_path'], _SCORE_RE_B, named_args=inspector_named_args, base_display_path=paths['root_dir'])
+            if not inspector_ok: analysis_score = "ANALYSIS_FAILED"
+            else: analysis_score = int(score_match.group(1)) if score_match else "SCORE_NOT_FOUND"
     
     # --- 최종 결과 집계 ---
     location_info = parse_signature_file(signature_decrypted_path_abs)
     # 파이프라인이 중간에 실패했다면 그 상태를, 성공했다면 일치도 검사 결과를 최종 상태로 결정
     final_status = comparison_result if pipeline_status == "OK" else pipeline_status
-    duplication_group = duplication_map.get(student_id, 'UNIQUE')
     
     logging.info(f"🏁 처리 완료: {student_id}, 최종 상태: {final_status}")
     
-    # 최종 리포트의 한 행이 될 딕셔너리 반환
-    return {
+    # 최종 리포트의 한 행이 될 딕셔너리
+    result = {
         'student_id': student_id, 'status': final_status, 
         'duplication_group': duplication_group, 
         'process_analysis_score': analysis_score, 'location': location_info
     }
+    # 모든 단계가 정상적으로 끝난 결과만 캐시 (일시적인 도구 실패가 캐시에 남지 않도록 함)
+    # 중복 그룹은 실행마다 다시 계산되므로 캐시에 저장하지 않음
+    if pipeline_status == "OK" and isinstance(analysis_score, int):
+        cached_result = {k: v for k, v in result.items() if k != 'duplication_group'}
+        store_cached_result(student_cache_dir, cache_key, student_output_dir_abs, artifact_names, cached_result)
+    return result
 
 # ==============================================================================
 #   메인 실행 로직 (Main Execution Logic)
 # ==============================================================================
 def main():
     """스크립트의 메인 진입점. 전체 오케스트레이션 로직을 포함합니다."""
+    # 실행 설정에 따라 시작 시 한 번만 준비하는 모듈 수준 상태
+    global _COMPARE_FILES, _INSPECTOR_SLOTS
     # 1. 로깅 설정: 모든 로그는 콘솔과 파일에 기록됨
     # [%(threadName)s]을 추가하여 병렬 처리 시 어떤 스레드가 로그를 남겼는지 확인 용이
     logging.basicConfig(
@@ -352,10 +943,20 @@ def main():
     # 2. 커맨드 라인 인자 파싱
     parser = argparse.ArgumentParser(description="Full pipeline orchestrator for student submissions.")
     parser.add_argument('--duration', type=int, required=True, help="과정 분석(inspector)을 위한 시험 시간(분 단위, 필수)")
+    parser.add_argument('--no-cache', action='store_true', help="이전 실행의 결과 캐시를 재사용하지 않고 모든 학생을 다시 처리")
+    cpu_count = os.cpu_count() or 1
+    parser.add_argument('--concurrency', type=int, default=min(64, 4 * cpu_count),
+                        help="동시에 처리할 학생 수 (기본값: CPU 코어 수의 4배, 최대 64)")
+    parser.add_argument('--inspector-concurrency', type=int, default=cpu_count,
+                        help="동시에 실행할 inspector 프로세스 수 (기본값: CPU 코어 수)")
     cli_args = parser.parse_args()
+    if cli_args.concurrency < 1 or cli_args.inspector_concurrency < 1:
+        parser.error("--concurrency와 --inspector-concurrency는 1 이상이어야 합니다.")
+    _INSPECTOR_SLOTS = threading.BoundedSemaphore(cli_args.inspector_concurrency)
     
     logging.info("🚀 전체 파이프라인 오케스트레이터 시작...")
     logging.info(f"Inspector 분석 시간: {cli_args.duration}분")
+    logging.info(f"동시 처리 학생 수: {cli_args.concurrency}, 동시 inspector 실행 수: {cli_args.inspector_concurrency}")
 
     # 3. 설정 파일(config.json) 로드 및 경로 구성
     # {기존 토드}}
@@ -363,7 +964,9 @@ def main():
     # {수정}
     # __file__ 대신 현재 작업 디렉토리를 기준으로 경로 설정
     # poetry run은 항상 프로젝트 루트(work/)에서 실행되므로 os.getcwd()가 안정적임
-    work_dir = Path(os.getcwd()) 
+    # 로그의 상대 경로 표시 기준으로도 쓰이므로, 여기서 한 번만 resolve()
+    # (work_dir에서 만드는 모든 경로가 root_dir과 같은 기준을 갖도록 work_dir 자체를 resolve)
+    work_dir = Path(os.getcwd()).resolve()
     root_dir = work_dir.parent
     try:
         with open(work_dir / "config.json", 'r', encoding='utf-8') as f:
@@ -383,7 +986,7 @@ def main():
     
     # `process_student_submission` 함수에 전달할 경로 묶음(paths 딕셔너리) 생성
     paths = {
-        "root_dir": root_dir, "processed_base_dir": processed_base_dir,
+        "root_dir": root_dir, "processed_base_dir": processed_base_dir, "cache_dir": work_dir / ".cache",
         "decoder_project_path": tools_dir / tools['decoder_project'], "restore_project_path": tools_dir / tools['restore_project'],
         "private_key_path": tools_dir / tools['private_key'], "diff_script_path": tools_dir / tools['diff_script'],
         "inspector_exe_path": tools_dir / tools['inspector'],
@@ -404,8 +1007,17 @@ def main():
     logging.info("=" * 60)
     logging.info("모든 도구의 의존성 확인 및 준비를 시작합니다...")
     tool_paths_to_prepare = [paths['decoder_project_path'], paths['restore_project_path']]
-    if not all(ensure_poetry_project_ready(p) for p in tool_paths_to_prepare):
+    # 각 도구의 'poetry install'은 서로 독립적이므로 동시에 실행
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(tool_paths_to_prepare)) as executor:
+        prepare_results = list(executor.map(ensure_poetry_project_ready, tool_paths_to_prepare))
+    if not all(prepare_results):
         logging.critical("하나 이상의 도구를 준비하는 데 실패했습니다. 프로그램을 중단합니다."); sys.exit(1)
+    # 가상환경 Python 경로는 실행 중 변하지 않으므로 준비 단계에서 기록한 값을 도구별로 한 번만 읽어 캐시
+    if not all(load_venv_python(p) for p in tool_paths_to_prepare):
+        logging.critical("도구의 가상환경 Python 경로를 확인하는 데 실패했습니다. 프로그램을 중단합니다."); sys.exit(1)
+
+    # 일치도 검사 함수는 학생마다 프로세스를 띄우지 않도록 한 번만 import
+    _COMPARE_FILES = load_diff_function(paths['diff_script_path'])
 
     # 6. 사전 분석 (중복 파일 검사)
     logging.info("=" * 60)
@@ -420,48 +1032,104 @@ def main():
             group_counter, current_group_id = 0, ''
             pattern = f"{re.escape(dirs['student_submission'])}[\\\\/](student-[^\\\\/]+)"
             student_id_pattern = re.compile(pattern)
-            for line in dup_result.stdout.strip().split('\n'):
-                if line.startswith("---"):
+            # 출력은 bytes로 받아 그룹 구분선과 파일 경로 줄만 골라서 디코딩
+            for raw_line in dup_result.stdout.strip().splitlines():
+                if raw_line.startswith(b"---"):
                     group_counter += 1
                     current_group_id = chr(ord('A') + group_counter - 1)
-                elif " - " in line and (match := student_id_pattern.search(line)):
+                elif b" - " in raw_line and (match := student_id_pattern.search(raw_line.decode('utf-8', errors='replace'))):
                     duplication_map[match.group(1)] = current_group_id
             logging.info(f"{group_counter}개의 중복 그룹을 찾았습니다.")
             
     # 7. 메인 파이프라인 실행 (병렬 처리)
     logging.info("=" * 60)
     logging.info("개별 학생 제출물에 대한 병렬 파이프라인 처리를 시작합니다...")
-    student_dirs = sorted([d for d in student_submission_dir.iterdir() if d.is_dir()])
-    report_data = []
+    # os.scandir의 DirEntry는 디렉터리 항목에 담긴 파일 종류를 재사용하므로, 학생 폴더마다 stat을 호출하지 않음
+    with os.scandir(student_submission_dir) as entries:
+        student_dirs = sorted((Path(entry.path) for entry in entries if entry.is_dir()), key=lambda d: d.name)
+    # 모든 학생에게 동일한 상대 경로는 학생마다 다시 계산하지 않도록 미리 계산
+    # 결과 캐시 키에 공통으로 들어갈 실행 환경 정보: Poetry 도구(decoder/restore)의 버전과 산출물 파일 이름
+    # 도구를 업그레이드하거나 config.json의 output_files를 바꾸면 이전 캐시가 재사용되지 않음
+    cache_salt = json.dumps({
+        "decoder": compute_poetry_tool_fingerprint(paths['decoder_project_path']),
+        "restore": compute_poetry_tool_fingerprint(paths['restore_project_path']),
+        "output_files": config['output_files'],
+    }, sort_keys=True)
+    rel_paths = {
+        "decoder_key": os.path.relpath(paths['private_key_path'], start=paths['decoder_project_path']),
+    }
 
     # ThreadPoolExecutor를 사용하여 학생 처리 작업을 병렬로 수행
-    # os.cpu_count()를 사용하여 시스템의 코어 수만큼 스레드를 생성 (효율 극대화)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
-        # 각 학생에 대한 작업을 스레드 풀에 제출. future 객체와 학생 폴더를 매핑하여 추적
-        future_to_student = {executor.submit(process_student_submission, sd, paths, config, cli_args, duplication_map): sd for sd in student_dirs}
-        
-    # [수정] as_completed 루프를 tqdm으로 감싸기
-    # total=len(student_dirs): 전체 작업 수를 알려주어 진행률 계산
-    # desc="Processing students": 진행률 표시줄 앞에 표시될 텍스트
-    for future in tqdm(concurrent.futures.as_completed(future_to_student), total=len(student_dirs), desc="Processing students"):
-            student_dir = future_to_student[future]
-            try:
-                # future.result(): 작업의 반환값(결과 딕셔너리)을 가져옴.
-                # 만약 작업 도중 예외가 발생했다면, 이 시점에서 예외가 다시 발생함.
-                report_data.append(future.result())
-            except Exception:
-                # 특정 학생 처리 중 예상치 못한 오류가 발생해도 전체 파이프라인은 멈추지 않음
-                logging.error(f"'{student_dir.name}' 처리 중 심각한 예외 발생", exc_info=True)
-                report_data.append({'student_id': student_dir.name, 'status': 'PIPELINE_CRASH', 'duplication_group': 'N/A', 'process_analysis_score': 'N/A', 'location': 'N/A'})
-
-    # 8. 최종 리포트 작성
+    # 학생 처리 시간의 대부분은 외부 도구 프로세스를 기다리는 시간이므로, 코어 수보다 많은 --concurrency 만큼 스레드를 생성
+    # 결과는 메모리에 모아두지 않고 완료되는 즉시 리포트 파일에 한 행씩 기록 (중단되더라도 처리된 결과는 보존됨)
+    # 행 기록은 메인 스레드의 결과 수거 루프에서만 일어나므로 별도의 잠금이 필요 없음
+    try:
+        report_file = open(report_csv_path, 'a', newline='', encoding='utf-8')
+    except IOError as e:
+        logging.critical(f"리포트 파일을 열 수 없습니다: {e}"); sys.exit(1)
+    # 중복 그룹(동일한 log.encrypted)마다 첫 번째 학생만 대표로 먼저 처리하고,
+    # 나머지 학생은 대표의 처리가 끝난 뒤 그 결과를 재사용하도록 제출
+    followers: Dict[str, List[Path]] = {}
+    group_representatives: Dict[str, str] = {}
+    initial_dirs = []
+    for sd in student_dirs:
+        group_id = duplication_map.get(sd.name)
+        representative_id = group_representatives.setdefault(group_id, sd.name) if group_id else sd.name
+        if representative_id == sd.name: initial_dirs.append(sd)
+        else: followers.setdefault(representative_id, []).append(sd)
+
+    # 도구별 상주 Python 프로세스를 미리 시작 (학생마다 인터프리터 기동과 모듈 import를 반복하지 않음)
+    # 시작에 실패한 도구는 기존처럼 실행마다 새 프로세스를 사용
+    tool_worker_count = min(cli_args.concurrency, cpu_count)
+    for p in tool_paths_to_prepare:
+        start_tool_workers(p, tool_worker_count)
+
+    # 처리 도중 예외로 빠져나가더라도 상주 프로세스는 항상 정리
+    try:
+        with report_file, concurrent.futures.ThreadPoolExecutor(max_workers=cli_args.concurrency) as executor, \
+                tqdm(total=len(student_dirs), desc="Processing students") as progress:
+            report_writer = csv.DictWriter(report_file, fieldnames=report_headers)
+            # 제출을 기다리는 (학생 폴더, 대표 학생 결과) 목록. 모든 학생을 한 번에 제출하지 않고,
+            # 처리 중인 작업 수가 스레드 수의 2배를 넘지 않도록 완료되는 만큼만 추가로 제출 (학생 수와 무관하게 메모리 사용량 유지)
+            pending_tasks = collections.deque((sd, None) for sd in initial_dirs)
+            max_in_flight = 2 * cli_args.concurrency
+            # 제출된 작업의 future 객체와 학생 폴더를 매핑하여 추적
+            future_to_student: Dict[concurrent.futures.Future, Path] = {}
+
+            # 모든 작업이 끝나기를 기다리지 않고 완료되는 즉시 결과를 수거함 (진행률 표시줄도 실제 진행 상황을 따라감)
+            # 대표 학생의 결과가 나오면 같은 그룹의 학생들이 제출 대기 목록에 추가되므로, 대기 목록과 추적 중인 작업이 모두 없어질 때까지 반복
+            while pending_tasks or future_to_student:
+                while pending_tasks and len(future_to_student) < max_in_flight:
+                    sd, representative = pending_tasks.popleft()
+                    future = executor.submit(process_student_submission, sd, paths, config, cli_args, duplication_map, rel_paths, cache_salt, representative)
+                    future_to_student[future] = sd
+                done, _ = concurrent.futures.wait(future_to_student, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    student_dir = future_to_student.pop(future)
+                    try:
+                        # future.result(): 작업의 반환값(결과 딕셔너리)을 가져옴.
+                        # 만약 작업 도중 예외가 발생했다면, 이 시점에서 예외가 다시 발생함.
+                        row = future.result()
+                    except Exception:
+                        # 특정 학생 처리 중 예상치 못한 오류가 발생해도 전체 파이프라인은 멈추지 않음
+                        logging.error(f"'{student_dir.name}' 처리 중 심각한 예외 발생", exc_info=True)
+                        row = {'student_id': student_dir.name, 'status': 'PIPELINE_CRASH', 'duplication_group': 'N/A', 'process_analysis_score': 'N/A', 'location': 'N/A'}
+                    pending_tasks.extend((follower_dir, row) for follower_dir in followers.pop(student_dir.name, []))
+                    try:
+                        report_writer.writerow(row)
+                        report_file.flush()
+                    except IOError as e:
+                        logging.error(f"리포트 파일에 '{row['student_id']}' 결과를 쓰는 데 실패했습니다: {e}")
+                    progress.update(1)
+    finally:
+        stop_tool_workers()
+
+    # 8. 최종 리포트 정렬
+    # 병렬 처리로 순서가 섞인 결과를 학생 ID 기준으로 정렬하여 보고서의 일관성 유지
     try:
-        with open(report_csv_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=report_headers)
-            # 병렬 처리로 순서가 섞인 결과를 학생 ID 기준으로 정렬하여 보고서의 일관성 유지
-            writer.writerows(sorted(report_data, key=lambda item: item['student_id']))
+        sort_report_csv(report_csv_path, 'student_id')
     except IOError as e:
-        logging.error(f"리포트 파일에 데이터를 쓰는 데 실패했습니다: {e}")
+        logging.error(f"리포트 파일을 정렬하는 데 실패했습니다: {e}")
     
     logging.info("=" * 60)
     logging.info("🎉 모든 파이프라인 작업이 완료되었습니다.")